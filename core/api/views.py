@@ -1,4 +1,5 @@
 from django.http import HttpRequest
+from django_q.tasks import async_task
 from ninja import NinjaAPI
 from ninja.errors import HttpError
 
@@ -38,19 +39,51 @@ def submit_blog_post(request: HttpRequest, data: BlogPostIn):
         return BlogPostOut(status="error", message="Forbidden: superuser access required."), 403
 
     try:
-        BlogPost.objects.create(
+        blog_post = BlogPost.objects.create(
             title=data.title,
             description=data.description,
             slug=data.slug,
             tags=data.tags,
             content=data.content,
             status=data.status,
-            # icon and image are ignored for now (file upload not handled)
         )
-        return BlogPostOut(status="success", message="Blog post submitted successfully.")
     except Exception as e:
         return BlogPostOut(status="failure", message=f"Failed to submit blog post: {str(e)}")
 
+    failed_fields = []
+    for field_name in ("icon", "image"):
+        payload = getattr(data, field_name)
+        if not payload:
+            continue
+        try:
+            async_task(
+                "core.tasks.ingest_blog_image",
+                blog_post_id=blog_post.id,
+                field_name=field_name,
+                payload=payload,
+                group="Ingest Blog Image",
+            )
+        except Exception as e:
+            logger.error(
+                "Failed to enqueue blog image ingestion",
+                error=str(e),
+                blog_post_id=blog_post.id,
+                field_name=field_name,
+                exc_info=True,
+            )
+            failed_fields.append(field_name)
+
+    if failed_fields:
+        return BlogPostOut(
+            status="success",
+            message=(
+                "Blog post submitted, but the following images could not be queued: "
+                f"{', '.join(failed_fields)}."
+            ),
+        )
+
+    return BlogPostOut(status="success", message="Blog post submitted successfully.")
+
 
 @api.get("/user/settings", response=UserSettingsOut, auth=[session_auth])
 def user_settings(request: HttpRequest):
@@ -22,6 +22,6 @@ class CoreConfig(AppConfig):
             posthog.api_key = settings.POSTHOG_API_KEY
             posthog.host = "https://us.i.posthog.com"
 
-        if settings.ENVIRONMENT == "dev":
+        if settings.DEBUG:
             posthog.debug = True
         
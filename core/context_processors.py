@@ -2,6 +2,8 @@ from allauth.socialaccount.models import SocialApp
 from django.conf import settings
 
 from core.choices import ProfileStates
+from core.models import Profile
+from core.utils import get_request_profile
 
 from knowthyself.utils import get_knowthyself_logger
 
@@ -10,7 +12,7 @@ logger = get_knowthyself_logger(__name__)
 
 def current_state(request):
     if request.user.is_authenticated:
-        return {"current_state": request.user.profile.current_state}
+        return {"current_state": get_request_profile(request).current_state}
     return {"current_state": ProfileStates.STRANGER}
 
 
@@ -19,8 +21,11 @@ def pro_subscription_status(request):
     Adds a 'has_pro_subscription' variable to the context.
     This variable is True if the user has an active pro subscription, False otherwise.
     """
-    if request.user.is_authenticated and hasattr(request.user, "profile"):
-        return {"has_pro_subscription": request.user.profile.has_active_subscription}
+    if request.user.is_authenticated:
+        try:
+            return {"has_pro_subscription": get_request_profile(request).has_active_subscription}
+        except Profile.DoesNotExist:
+            pass
     return {"has_pro_subscription": False}
 
 
@@ -2,7 +2,7 @@ from allauth.account.forms import LoginForm, SignupForm
 from django import forms
 
 from core.models import Profile, Source
-from core.utils import DivErrorList
+from core.utils import DivErrorList, clear_email_verified
 
 
 class CustomSignUpForm(SignupForm):
@@ -42,6 +42,7 @@ class ProfileUpdateForm(forms.ModelForm):
         if commit:
             user.save()
             profile.save()
+            clear_email_verified(user.id)
         return profile
 
 
@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_hackernewscomment_hackernewsstory_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=models.Index(fields=['status', '-created_at'], name='blogpost_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='hackernewsstory',
+            index=models.Index(fields=['profile', '-post_created_at_i'], name='hnstory_profile_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='hackernewscomment',
+            index=models.Index(fields=['profile', '-comment_created_at_i'], name='hncomment_profile_created_idx'),
+        ),
+    ]
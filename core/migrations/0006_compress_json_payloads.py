@@ -0,0 +1,114 @@
+from django.db import migrations
+
+import core.model_utils
+
+COMPRESSED_FIELDS = [
+    ("hackernewsstory", "highlight_result"),
+    ("hackernewscomment", "highlight_result"),
+    ("personalwebsitepage", "meta_data"),
+    ("personalwebsitepage", "links"),
+    ("personalwebsitepage", "images"),
+]
+
+
+BATCH_SIZE = 500
+
+
+def copy_fields(from_suffix, to_suffix):
+    def copy(apps, schema_editor):
+        for model_name, field_name in COMPRESSED_FIELDS:
+            model = apps.get_model("core", model_name)
+            source, target = f"{field_name}{from_suffix}", f"{field_name}{to_suffix}"
+
+            objs = []
+            for obj in model.objects.only("pk", source).iterator(chunk_size=BATCH_SIZE):
+                setattr(obj, target, getattr(obj, source))
+                objs.append(obj)
+                if len(objs) >= BATCH_SIZE:
+                    model.objects.bulk_update(objs, [target])
+                    objs = []
+            if objs:
+                model.objects.bulk_update(objs, [target])
+
+    return copy
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_blogpost_hackernews_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='hackernewsstory',
+            name='highlight_result_compressed',
+            field=core.model_utils.CompressedJSONField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='hackernewscomment',
+            name='highlight_result_compressed',
+            field=core.model_utils.CompressedJSONField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='personalwebsitepage',
+            name='meta_data_compressed',
+            field=core.model_utils.CompressedJSONField(blank=True, default=dict),
+        ),
+        migrations.AddField(
+            model_name='personalwebsitepage',
+            name='links_compressed',
+            field=core.model_utils.CompressedJSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='personalwebsitepage',
+            name='images_compressed',
+            field=core.model_utils.CompressedJSONField(blank=True, default=list),
+        ),
+        migrations.RunPython(copy_fields("", "_compressed"), copy_fields("_compressed", "")),
+        migrations.RemoveField(
+            model_name='hackernewsstory',
+            name='highlight_result',
+        ),
+        migrations.RemoveField(
+            model_name='hackernewscomment',
+            name='highlight_result',
+        ),
+        migrations.RemoveField(
+            model_name='personalwebsitepage',
+            name='meta_data',
+        ),
+        migrations.RemoveField(
+            model_name='personalwebsitepage',
+            name='links',
+        ),
+        migrations.RemoveField(
+            model_name='personalwebsitepage',
+            name='images',
+        ),
+        migrations.RenameField(
+            model_name='hackernewsstory',
+            old_name='highlight_result_compressed',
+            new_name='highlight_result',
+        ),
+        migrations.RenameField(
+            model_name='hackernewscomment',
+            old_name='highlight_result_compressed',
+            new_name='highlight_result',
+        ),
+        migrations.RenameField(
+            model_name='personalwebsitepage',
+            old_name='meta_data_compressed',
+            new_name='meta_data',
+        ),
+        migrations.RenameField(
+            model_name='personalwebsitepage',
+            old_name='links_compressed',
+            new_name='links',
+        ),
+        migrations.RenameField(
+            model_name='personalwebsitepage',
+            old_name='images_compressed',
+            new_name='images',
+        ),
+    ]
@@ -0,0 +1,23 @@
+from django.db import migrations
+
+import core.model_utils
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_compress_json_payloads'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='hackernewsstory',
+            name='tags',
+            field=core.model_utils.OrjsonJSONField(blank=True, default=list),
+        ),
+        migrations.AlterField(
+            model_name='hackernewscomment',
+            name='tags',
+            field=core.model_utils.OrjsonJSONField(blank=True, default=list),
+        ),
+    ]
@@ -1,16 +1,67 @@
 from django.contrib.auth.models import User
-from django.db import models
+from django.db import models, transaction
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
 from django.urls import reverse
+from django.utils.functional import cached_property
 from django_q.tasks import async_task
 
 from core.base_models import BaseModel
 from core.choices import BlogPostStatus, ProfileStates
-from core.model_utils import generate_random_key
+from core.model_utils import CompressedJSONField, OrjsonJSONField, generate_random_key
 from knowthyself.utils import get_knowthyself_logger
 
 logger = get_knowthyself_logger(__name__)
 
 
+class ProfileQuerySet(models.QuerySet):
+    def with_current_state(self):
+        """Annotate each profile with the `to_state` of its latest transition."""
+        latest_transition = (
+            ProfileStateTransition.objects.filter(profile=OuterRef("pk"))
+            .order_by("-created_at")
+            .values("to_state")[:1]
+        )
+        return self.annotate(
+            _current_state=Coalesce(Subquery(latest_transition), Value(ProfileStates.STRANGER))
+        )
+
+    def bulk_create_with_unique_keys(self, objs, max_attempts=3):
+        """
+        Bulk insert profiles, regenerating `key` for rows that were skipped on a conflict.
+        Returns the profiles that still could not be inserted.
+        """
+        pending = list(objs)
+        for _ in range(max_attempts):
+            self.bulk_create(pending, ignore_conflicts=True)
+            inserted = set(
+                self.filter(key__in=[profile.key for profile in pending]).values_list(
+                    "key", "user_id"
+                )
+            )
+            pending = [
+                profile for profile in pending if (profile.key, profile.user_id) not in inserted
+            ]
+            if not pending:
+                break
+            for profile in pending:
+                profile.key = generate_random_key()
+
+        if pending:
+            logger.warning(
+                "Could not insert all profiles",
+                user_ids=[profile.user_id for profile in pending],
+            )
+        return pending
+
+
+class ProfileUserManager(models.Manager):
+    """Joins the owning profile and user, which `__str__` always reads."""
+
+    def get_queryset(self):
+        return super().get_queryset().select_related("profile__user")
+
+
 class Profile(BaseModel):
     user = models.OneToOneField(User, on_delete=models.CASCADE)
     key = models.CharField(max_length=30, unique=True, default=generate_random_key)
@@ -48,6 +99,8 @@ class Profile(BaseModel):
         help_text="The current state of the user's profile",
     )
 
+    objects = ProfileQuerySet.as_manager()
+
     def track_state_change(self, to_state, metadata=None):
         async_task(
             "core.tasks.track_state_change",
@@ -58,13 +111,24 @@ class Profile(BaseModel):
             source_function="Profile - track_state_change",
             group="Track State Change",
         )
+        self.clear_cached_state()
 
-    @property
+    def clear_cached_state(self):
+        """Drop memoized state so the next access re-reads the latest transition."""
+        self.__dict__.pop("current_state", None)
+        self.__dict__.pop("_current_state", None)
+
+    @cached_property
     def current_state(self):
-        if not self.state_transitions.all().exists():
-            return ProfileStates.STRANGER
-        latest_transition = self.state_transitions.latest("created_at")
-        return latest_transition.to_state
+        if "_current_state" in self.__dict__:
+            return self._current_state
+
+        latest_state = (
+            self.state_transitions.order_by("-created_at")
+            .values_list("to_state", flat=True)
+            .first()
+        )
+        return latest_state or ProfileStates.STRANGER
 
     @property
     def has_active_subscription(self):
@@ -106,6 +170,11 @@ class BlogPost(BaseModel):
         default=BlogPostStatus.DRAFT,
     )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "-created_at"], name="blogpost_status_created_idx"),
+        ]
+
     def __str__(self):
         return self.title
 
@@ -130,6 +199,8 @@ class Feedback(BaseModel):
         help_text="The page where the feedback was submitted",
     )
 
+    objects = ProfileUserManager()
+
     def __str__(self):
         return f"{self.profile.user.email}: {self.feedback}"
 
@@ -138,20 +209,13 @@ class Feedback(BaseModel):
         super().save(*args, **kwargs)
 
         if is_new:
-            from django.conf import settings
-            from django.core.mail import send_mail
-
-            subject = "New Feedback Submitted"
-            message = f"""
-                New feedback was submitted:\n\n
-                User: {self.profile.user.email if self.profile else "Anonymous"}
-                Feedback: {self.feedback}
-                Page: {self.page}
-            """
-            from_email = settings.DEFAULT_FROM_EMAIL
-            recipient_list = [settings.DEFAULT_FROM_EMAIL]
-
-            send_mail(subject, message, from_email, recipient_list, fail_silently=True)
+            transaction.on_commit(
+                lambda: async_task(
+                    "core.tasks.send_feedback_email",
+                    feedback_id=self.pk,
+                    group="Feedback Email",
+                )
+            )
 
 
 class Source(BaseModel):
@@ -165,6 +229,8 @@ class Source(BaseModel):
     personal_website = models.URLField(blank=True)
     hacker_news_username = models.CharField(blank=True, max_length=255)
 
+    objects = ProfileUserManager()
+
     def __str__(self):
         return f"{self.profile.user.email}"
 
@@ -201,10 +267,17 @@ class HackerNewsStory(BaseModel):
     post_updated_at = models.DateTimeField()  # from "updated_at"
 
     # Tags (optional - if you want to store the tags)
-    tags = models.JSONField(default=list, blank=True)  # from "_tags"
+    tags = OrjsonJSONField(default=list, blank=True)  # from "_tags"
 
     # Highlight results (optional - if you need search highlighting)
-    highlight_result = models.JSONField(null=True, blank=True)  # from "_highlightResult"
+    highlight_result = CompressedJSONField(null=True, blank=True)  # from "_highlightResult"
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["profile", "-post_created_at_i"], name="hnstory_profile_created_idx"
+            ),
+        ]
 
 
 class HackerNewsComment(BaseModel):
@@ -240,10 +313,17 @@ class HackerNewsComment(BaseModel):
     comment_updated_at = models.DateTimeField()  # from "updated_at"
 
     # Tags (optional)
-    tags = models.JSONField(default=list, blank=True)  # from "_tags"
+    tags = OrjsonJSONField(default=list, blank=True)  # from "_tags"
 
     # Highlight results (optional)
-    highlight_result = models.JSONField(null=True, blank=True)  # from "_highlightResult"
+    highlight_result = CompressedJSONField(null=True, blank=True)  # from "_highlightResult"
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["profile", "-comment_created_at_i"], name="hncomment_profile_created_idx"
+            ),
+        ]
 
 
 class PersonalWebsitePage(BaseModel):
@@ -266,10 +346,10 @@ class PersonalWebsitePage(BaseModel):
     content = models.TextField(blank=True)
     word_count = models.IntegerField(default=0)
 
-    meta_data = models.JSONField(default=dict, blank=True)
+    meta_data = CompressedJSONField(default=dict, blank=True)
 
-    links = models.JSONField(default=list, blank=True)
-    images = models.JSONField(default=list, blank=True)
+    links = CompressedJSONField(default=list, blank=True)
+    images = CompressedJSONField(default=list, blank=True)
 
     published_date = models.DateTimeField(null=True, blank=True)
     last_modified = models.DateTimeField(null=True, blank=True)
@@ -5,6 +5,7 @@ from django.dispatch import receiver
 from django_q.tasks import async_task
 
 from core.tasks import add_email_to_buttondown
+from core.utils import clear_email_verified
 from core.models import Profile, ProfileStates
 from knowthyself.utils import get_knowthyself_logger
 
@@ -38,6 +39,11 @@ def add_email_to_buttondown_on_confirm(sender, **kwargs):
     async_task(add_email_to_buttondown, kwargs["email_address"], tag="user")
 
 
+@receiver(email_confirmed)
+def clear_email_verified_on_confirm(sender, email_address, **kwargs):
+    clear_email_verified(email_address.user_id)
+
+
 @receiver(user_signed_up)
 def email_confirmation_callback(sender, request, user, **kwargs):
     if 'sociallogin' in kwargs:
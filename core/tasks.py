@@ -1,17 +1,30 @@
+import base64
+import binascii
+import io
 import json
-from urllib.parse import unquote
+import mimetypes
+import tempfile
+from urllib.parse import unquote, urlparse
 
 import posthog
 
 
 import requests
 from django.conf import settings
+from django.core.files import File
+from django.core.files.base import ContentFile
+from django.core.mail import send_mail
+from PIL import Image, UnidentifiedImageError
 
-from core.models import Profile
+from core.models import BlogPost, Feedback, Profile
 from knowthyself.utils import get_knowthyself_logger
 
 logger = get_knowthyself_logger(__name__)
 
+http_session = requests.Session()
+
+MAX_BLOG_IMAGE_BYTES = 5 * 1024 * 1024
+
 def add_email_to_buttondown(email, tag):
     if not settings.BUTTONDOWN_API_KEY:
         return "Buttondown API key not found."
@@ -33,6 +46,28 @@ def add_email_to_buttondown(email, tag):
     return r.json()
 
 
+def send_feedback_email(feedback_id: int) -> str:
+    try:
+        feedback = Feedback.objects.select_related("profile__user").get(id=feedback_id)
+    except Feedback.DoesNotExist:
+        logger.error("[SendFeedbackEmail] Feedback not found.", feedback_id=feedback_id)
+        return f"Feedback with id {feedback_id} not found."
+
+    subject = "New Feedback Submitted"
+    message = f"""
+        New feedback was submitted:\n\n
+        User: {feedback.profile.user.email if feedback.profile else "Anonymous"}
+        Feedback: {feedback.feedback}
+        Page: {feedback.page}
+    """
+    from_email = settings.DEFAULT_FROM_EMAIL
+    recipient_list = [settings.DEFAULT_FROM_EMAIL]
+
+    send_mail(subject, message, from_email, recipient_list, fail_silently=True)
+
+    return f"Sent feedback email for feedback {feedback_id}"
+
+
 def try_create_posthog_alias(profile_id: int, cookies: dict, source_function: str = None) -> str:
     if not settings.POSTHOG_API_KEY:
         return "PostHog API key not found."
@@ -102,9 +137,39 @@ def track_event(
     return f"Tracked event {event_name} for profile {profile_id}"
 
 
+def signup_posthog_bundle(
+    profile_id: int, cookies: dict, email: str, username: str, source_function: str = None
+) -> str:
+    if not settings.POSTHOG_API_KEY:
+        return "PostHog API key not found."
+
+    try_create_posthog_alias(
+        profile_id=profile_id,
+        cookies=cookies,
+        source_function=source_function,
+    )
+    track_event(
+        profile_id=profile_id,
+        event_name="user_signed_up",
+        properties={
+            "$set": {
+                "email": email,
+                "username": username,
+            },
+        },
+        source_function=source_function,
+    )
+    posthog.flush()
+
+    return f"Tracked signup in PostHog for profile {profile_id}"
+
 
 def track_state_change(
-    profile_id: int, from_state: str, to_state: str, metadata: dict = None
+    profile_id: int,
+    from_state: str,
+    to_state: str,
+    metadata: dict = None,
+    source_function: str = None,
 ) -> None:
     from core.models import Profile, ProfileStateTransition
 
@@ -113,6 +178,7 @@ def track_state_change(
         "from_state": from_state,
         "to_state": to_state,
         "metadata": metadata,
+        "source_function": source_function,
     }
 
     try:
@@ -134,3 +200,105 @@ def track_state_change(
         profile.save(update_fields=["state"])
 
     return f"Tracked state change from {from_state} to {to_state} for profile {profile_id}"
+
+
+def _guess_image_extension(content: bytes) -> str | None:
+    try:
+        with Image.open(io.BytesIO(content)) as image:
+            return f".{image.format.lower()}"
+    except (UnidentifiedImageError, OSError):
+        return None
+
+
+def _save_downloaded_blog_image(blog_post, field_name, url, log_data) -> str | None:
+    try:
+        with http_session.get(url, stream=True, timeout=30) as response:
+            response.raise_for_status()
+
+            content_type = response.headers.get("Content-Type", "").split(";")[0].strip()
+            if not content_type.startswith("image/"):
+                logger.error(
+                    "[IngestBlogImage] URL did not return an image.",
+                    content_type=content_type,
+                    **log_data,
+                )
+                return f"URL for {field_name} of blog post {blog_post.id} is not an image."
+
+            if int(response.headers.get("Content-Length") or 0) > MAX_BLOG_IMAGE_BYTES:
+                logger.error("[IngestBlogImage] Image is too large.", **log_data)
+                return f"The {field_name} for blog post {blog_post.id} is too large."
+
+            with tempfile.SpooledTemporaryFile(max_size=1024 * 1024) as tmp:
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    tmp.write(chunk)
+                    if tmp.tell() > MAX_BLOG_IMAGE_BYTES:
+                        logger.error("[IngestBlogImage] Image is too large.", **log_data)
+                        return f"The {field_name} for blog post {blog_post.id} is too large."
+                tmp.seek(0)
+
+                extension = (
+                    mimetypes.guess_extension(content_type)
+                    or mimetypes.guess_extension(mimetypes.guess_type(urlparse(url).path)[0] or "")
+                    or ".png"
+                )
+                getattr(blog_post, field_name).save(
+                    f"{blog_post.slug}{extension}", File(tmp), save=False
+                )
+    except requests.RequestException as e:
+        logger.error("[IngestBlogImage] Failed to download image.", error=str(e), **log_data)
+        return f"Failed to download {field_name} for blog post {blog_post.id}."
+
+    return None
+
+
+def _save_base64_blog_image(blog_post, field_name, payload, log_data) -> str | None:
+    header, _, encoded = payload.rpartition(";base64,")
+    try:
+        content = base64.b64decode(encoded, validate=True)
+    except binascii.Error as e:
+        logger.error("[IngestBlogImage] Invalid base64 payload.", error=str(e), **log_data)
+        return f"Invalid base64 {field_name} for blog post {blog_post.id}."
+
+    if len(content) > MAX_BLOG_IMAGE_BYTES:
+        logger.error("[IngestBlogImage] Image is too large.", **log_data)
+        return f"The {field_name} for blog post {blog_post.id} is too large."
+
+    if header:
+        extension = mimetypes.guess_extension(header.removeprefix("data:")) or ".png"
+    else:
+        extension = _guess_image_extension(content)
+        if extension is None:
+            logger.error("[IngestBlogImage] Base64 payload is not an image.", **log_data)
+            return f"Invalid base64 {field_name} for blog post {blog_post.id}."
+
+    getattr(blog_post, field_name).save(
+        f"{blog_post.slug}{extension}", ContentFile(content), save=False
+    )
+    return None
+
+
+def ingest_blog_image(blog_post_id: int, field_name: str, payload: str) -> str:
+    """Save a remote image URL, data URI or bare base64 string into `BlogPost.icon`/`.image`."""
+    base_log_data = {
+        "blog_post_id": blog_post_id,
+        "field_name": field_name,
+    }
+
+    try:
+        blog_post = BlogPost.objects.get(id=blog_post_id)
+    except BlogPost.DoesNotExist:
+        logger.error("[IngestBlogImage] Blog post not found.", **base_log_data)
+        return f"Blog post with id {blog_post_id} not found."
+
+    if urlparse(payload).scheme in ("http", "https"):
+        error = _save_downloaded_blog_image(blog_post, field_name, payload, base_log_data)
+    else:
+        error = _save_base64_blog_image(blog_post, field_name, payload, base_log_data)
+    if error:
+        return error
+
+    blog_post.save(update_fields=[field_name, "updated_at"])
+
+    logger.info("[IngestBlogImage] Saved blog image", **base_log_data)
+
+    return f"Saved {field_name} for blog post {blog_post_id}"
@@ -1,7 +1,32 @@
+import pytest
 from django.conf import settings
+from django.core.cache import cache
 from django.core.management import call_command
+from django_q.conf import Conf
 
 def pytest_configure(config):
     settings.STORAGES['staticfiles']['BACKEND'] = (
         'django.contrib.staticfiles.storage.StaticFilesStorage'
     )
+    settings.CACHES = {
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}
+    }
+
+
+@pytest.fixture(autouse=True)
+def disable_external_apis(settings):
+    """Blank third-party keys so tasks return early instead of calling real APIs."""
+    settings.BUTTONDOWN_API_KEY = ""
+    settings.POSTHOG_API_KEY = ""
+
+
+@pytest.fixture(autouse=True)
+def sync_django_q(monkeypatch, disable_external_apis):
+    """Run `async_task` calls inline so tests don't need a broker."""
+    monkeypatch.setattr(Conf, "SYNC", True)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    yield
+    cache.clear()
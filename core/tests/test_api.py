@@ -0,0 +1,38 @@
+import pytest
+from django.contrib.auth.models import User
+
+from core.api import views as api_views
+from core.models import BlogPost
+
+
+@pytest.fixture
+def superuser_key(db):
+    user = User.objects.create_superuser(username="admin", email="admin@test.com", password="x")
+    return user.profile.key
+
+
+@pytest.mark.django_db
+class TestSubmitBlogPost:
+    def test_reports_images_that_could_not_be_queued(self, client, superuser_key, monkeypatch):
+        def raise_broker_error(*args, **kwargs):
+            raise ConnectionError("broker unavailable")
+
+        monkeypatch.setattr(api_views, "async_task", raise_broker_error)
+
+        response = client.post(
+            f"/api/blog-posts/submit?api_key={superuser_key}",
+            data={
+                "title": "Hello",
+                "slug": "hello",
+                "content": "Hello world",
+                "image": "https://example.com/a.png",
+            },
+            content_type="application/json",
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "status": "success",
+            "message": "Blog post submitted, but the following images could not be queued: image.",
+        }
+        assert BlogPost.objects.filter(slug="hello").exists()
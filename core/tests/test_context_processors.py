@@ -0,0 +1,27 @@
+import pytest
+from django.contrib.auth.models import User
+from django.test import RequestFactory
+
+from core.context_processors import current_state, pro_subscription_status
+
+
+@pytest.mark.django_db
+class TestProfileContextProcessors:
+    def test_share_a_single_profile_query(self, django_assert_num_queries):
+        # On a fresh database the first user (id 1) is promoted to superuser by a signal.
+        User.objects.create_user(username="admin", email="admin@test.com", password="test")
+        user = User.objects.create_user(username="test", email="test@test.com", password="test")
+        assert not user.is_superuser
+        request = RequestFactory().get("/")
+        request.user = User.objects.get(pk=user.pk)
+
+        with django_assert_num_queries(1):
+            current_state(request)
+            assert pro_subscription_status(request) == {"has_pro_subscription": False}
+
+    def test_user_without_profile(self):
+        (user,) = User.objects.bulk_create([User(username="test")])
+        request = RequestFactory().get("/")
+        request.user = user
+
+        assert pro_subscription_status(request) == {"has_pro_subscription": False}
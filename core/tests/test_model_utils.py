@@ -0,0 +1,117 @@
+import pytest
+from django.core import serializers
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.utils import timezone
+
+from core.model_utils import CompressedJSONField
+from core.models import HackerNewsStory
+
+
+def create_story(model=HackerNewsStory, **kwargs):
+    now = timezone.now()
+    return model.objects.create(
+        story_id=1,
+        title="Show HN",
+        author="pg",
+        post_created_at=now,
+        post_created_at_i=int(now.timestamp()),
+        post_updated_at=now,
+        **kwargs,
+    )
+
+
+class TestCompressedJSONField:
+    def test_small_payload_is_stored_raw(self):
+        field = CompressedJSONField()
+        value = {"title": {"value": "Show HN"}}
+
+        encoded = field.get_prep_value(value)
+
+        assert encoded[:1] == CompressedJSONField.RAW_MARKER
+        assert field.from_db_value(memoryview(encoded), None, None) == value
+
+    def test_payload_over_threshold_is_compressed(self):
+        field = CompressedJSONField()
+        value = {"text": "x" * (CompressedJSONField.COMPRESSION_THRESHOLD + 1)}
+
+        encoded = field.get_prep_value(value)
+
+        assert encoded[:1] == CompressedJSONField.COMPRESSED_MARKER
+        assert len(encoded) < CompressedJSONField.COMPRESSION_THRESHOLD
+        assert field.from_db_value(memoryview(encoded), None, None) == value
+
+    def test_none_is_passed_through(self):
+        field = CompressedJSONField(null=True)
+
+        assert field.get_prep_value(None) is None
+        assert field.from_db_value(None, None, None) is None
+
+    def test_to_python_parses_json_text(self):
+        assert CompressedJSONField().to_python('{"a": [1, 2]}') == {"a": [1, 2]}
+
+
+@pytest.mark.django_db
+class TestCompressedJSONFieldStorage:
+    def test_round_trips_through_database(self):
+        highlight_result = {"title": {"value": "y" * 5000}}
+        story = create_story(highlight_result=highlight_result)
+
+        story.refresh_from_db()
+
+        assert story.highlight_result == highlight_result
+
+    def test_null_round_trips_through_database(self):
+        story = create_story(highlight_result=None)
+
+        story.refresh_from_db()
+
+        assert story.highlight_result is None
+
+    def test_round_trips_through_serializer(self):
+        highlight_result = {"title": {"value": "Show HN", "matchLevel": "full"}}
+        create_story(highlight_result=highlight_result)
+
+        data = serializers.serialize("json", HackerNewsStory.objects.all())
+        deserialized = next(serializers.deserialize("json", data))
+
+        assert deserialized.object.highlight_result == highlight_result
+
+        deserialized.save()
+        assert HackerNewsStory.objects.get().highlight_result == highlight_result
+
+
+@pytest.mark.django_db(transaction=True)
+class TestCompressJSONPayloadsMigration:
+    migrate_from = [("core", "0005_blogpost_hackernews_indexes")]
+    migrate_to = [("core", "0006_compress_json_payloads")]
+
+    def test_copies_existing_json_into_compressed_fields(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(self.migrate_from)
+        old_apps = executor.loader.project_state(self.migrate_from).apps
+
+        highlight_result = {"title": {"value": "z" * 2000}}
+        create_story(
+            model=old_apps.get_model("core", "HackerNewsStory"),
+            highlight_result=highlight_result,
+        )
+        old_apps.get_model("core", "PersonalWebsitePage").objects.create(
+            meta_data={"title": "Home"}, links=["https://example.com"], images=[]
+        )
+
+        try:
+            executor = MigrationExecutor(connection)
+            executor.migrate(self.migrate_to)
+            new_apps = executor.loader.project_state(self.migrate_to).apps
+
+            story = new_apps.get_model("core", "HackerNewsStory").objects.get()
+            page = new_apps.get_model("core", "PersonalWebsitePage").objects.get()
+
+            assert story.highlight_result == highlight_result
+            assert page.meta_data == {"title": "Home"}
+            assert page.links == ["https://example.com"]
+            assert page.images == []
+        finally:
+            executor = MigrationExecutor(connection)
+            executor.migrate(executor.loader.graph.leaf_nodes())
@@ -0,0 +1,75 @@
+import pytest
+from django.contrib.auth.models import User
+
+from core.choices import ProfileStates
+from core.models import Profile
+
+
+@pytest.fixture
+def profile(db):
+    user = User.objects.create_user(username="test", email="test@test.com", password="test")
+    return user.profile
+
+
+@pytest.mark.django_db
+class TestProfileCurrentState:
+    def test_current_state_is_cached(self, profile, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            assert profile.current_state == ProfileStates.SIGNED_UP
+            assert profile.current_state == ProfileStates.SIGNED_UP
+
+    def test_track_state_change_invalidates_cached_state(self, profile):
+        assert profile.current_state == ProfileStates.SIGNED_UP
+
+        profile.track_state_change(to_state=ProfileStates.SUBSCRIBED)
+
+        assert profile.current_state == ProfileStates.SUBSCRIBED
+
+
+@pytest.mark.django_db
+class TestProfileHasActiveSubscription:
+    def test_follows_profile_state(self, profile):
+        assert not profile.has_active_subscription
+
+        profile.track_state_change(to_state=ProfileStates.SUBSCRIBED)
+        profile.refresh_from_db()
+
+        assert profile.has_active_subscription
+
+    def test_survives_full_profile_save_from_user_save(self, profile):
+        user = profile.user
+        profile.track_state_change(to_state=ProfileStates.SUBSCRIBED)
+
+        # `save_user_profile` re-saves the stale in-memory profile on every User.save().
+        user.save()
+
+        profile = Profile.objects.with_current_state().get(user=user)
+        assert profile.current_state == ProfileStates.SUBSCRIBED
+        assert profile.has_active_subscription
+
+
+@pytest.mark.django_db
+class TestProfileBulkCreateWithUniqueKeys:
+    def test_regenerates_key_on_collision(self, profile):
+        first, second = User.objects.bulk_create(
+            [User(username="first"), User(username="second")]
+        )
+        colliding = Profile(user=first, key=profile.key)
+
+        pending = Profile.objects.bulk_create_with_unique_keys([colliding, Profile(user=second)])
+
+        assert pending == []
+        assert Profile.objects.filter(user__in=[first, second]).count() == 2
+        assert Profile.objects.get(user=first).key != profile.key
+
+    def test_returns_profiles_conflicting_on_user(self, profile):
+        (other_user,) = User.objects.bulk_create([User(username="other")])
+        duplicate = Profile(user=profile.user)
+
+        pending = Profile.objects.bulk_create_with_unique_keys(
+            [duplicate, Profile(user=other_user)]
+        )
+
+        assert pending == [duplicate]
+        assert Profile.objects.filter(user=profile.user).count() == 1
+        assert Profile.objects.filter(user=other_user).exists()
@@ -0,0 +1,131 @@
+import base64
+import io
+
+import pytest
+import requests
+
+from core import tasks
+from core.models import BlogPost
+
+# 1x1 transparent PNG
+PNG_BYTES = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII="
+)
+
+
+@pytest.fixture(autouse=True)
+def media_storage(settings, tmp_path):
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "default": {
+            "BACKEND": "django.core.files.storage.FileSystemStorage",
+            "OPTIONS": {"location": tmp_path},
+        },
+    }
+
+
+def fake_response(body, content_type):
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = content_type
+    response.raw = io.BytesIO(body)
+    return response
+
+
+@pytest.fixture
+def blog_post(db):
+    return BlogPost.objects.create(title="Hello", slug="hello", content="Hello world")
+
+
+@pytest.mark.django_db
+class TestIngestBlogImage:
+    def test_saves_base64_data_uri(self, blog_post):
+        payload = f"data:image/png;base64,{base64.b64encode(PNG_BYTES).decode()}"
+
+        result = tasks.ingest_blog_image(blog_post.id, "icon", payload)
+
+        blog_post.refresh_from_db()
+        assert result == f"Saved icon for blog post {blog_post.id}"
+        assert blog_post.icon.name.startswith("blog_post_icons/hello")
+        assert blog_post.icon.name.endswith(".png")
+        with blog_post.icon.open("rb") as f:
+            assert f.read() == PNG_BYTES
+
+    def test_saves_bare_base64(self, blog_post):
+        result = tasks.ingest_blog_image(blog_post.id, "icon", base64.b64encode(PNG_BYTES).decode())
+
+        blog_post.refresh_from_db()
+        assert result == f"Saved icon for blog post {blog_post.id}"
+        assert blog_post.icon.name.endswith(".png")
+
+    def test_rejects_bare_base64_that_is_not_an_image(self, blog_post):
+        payload = base64.b64encode(b"not an image").decode()
+
+        result = tasks.ingest_blog_image(blog_post.id, "icon", payload)
+
+        blog_post.refresh_from_db()
+        assert result == f"Invalid base64 icon for blog post {blog_post.id}."
+        assert not blog_post.icon
+
+    def test_rejects_invalid_base64(self, blog_post):
+        result = tasks.ingest_blog_image(blog_post.id, "image", "data:image/png;base64,not*base64")
+
+        blog_post.refresh_from_db()
+        assert result == f"Invalid base64 image for blog post {blog_post.id}."
+        assert not blog_post.image
+
+    def test_saves_downloaded_image(self, blog_post, monkeypatch):
+        monkeypatch.setattr(
+            tasks.http_session, "get", lambda *args, **kwargs: fake_response(PNG_BYTES, "image/png")
+        )
+
+        result = tasks.ingest_blog_image(blog_post.id, "image", "https://example.com/a")
+
+        blog_post.refresh_from_db()
+        assert result == f"Saved image for blog post {blog_post.id}"
+        assert blog_post.image.name.startswith("blog_post_images/hello")
+        assert blog_post.image.name.endswith(".png")
+        with blog_post.image.open("rb") as f:
+            assert f.read() == PNG_BYTES
+
+    def test_rejects_non_image_download(self, blog_post, monkeypatch):
+        monkeypatch.setattr(
+            tasks.http_session,
+            "get",
+            lambda *args, **kwargs: fake_response(b"<html></html>", "text/html; charset=utf-8"),
+        )
+
+        result = tasks.ingest_blog_image(blog_post.id, "image", "https://example.com/a.png")
+
+        blog_post.refresh_from_db()
+        assert result == f"URL for image of blog post {blog_post.id} is not an image."
+        assert not blog_post.image
+
+    def test_rejects_oversized_download(self, blog_post, monkeypatch):
+        monkeypatch.setattr(tasks, "MAX_BLOG_IMAGE_BYTES", 10)
+        monkeypatch.setattr(
+            tasks.http_session, "get", lambda *args, **kwargs: fake_response(PNG_BYTES, "image/png")
+        )
+
+        result = tasks.ingest_blog_image(blog_post.id, "image", "https://example.com/a.png")
+
+        blog_post.refresh_from_db()
+        assert result == f"The image for blog post {blog_post.id} is too large."
+        assert not blog_post.image
+
+    def test_reports_failed_download(self, blog_post, monkeypatch):
+        def raise_connection_error(*args, **kwargs):
+            raise requests.ConnectionError("unreachable")
+
+        monkeypatch.setattr(tasks.http_session, "get", raise_connection_error)
+
+        result = tasks.ingest_blog_image(blog_post.id, "image", "https://example.com/a.png")
+
+        blog_post.refresh_from_db()
+        assert result == f"Failed to download image for blog post {blog_post.id}."
+        assert not blog_post.image
+
+    def test_missing_blog_post(self):
+        assert tasks.ingest_blog_image(0, "icon", "data:image/png;base64,") == (
+            "Blog post with id 0 not found."
+        )
@@ -0,0 +1,63 @@
+import pytest
+from allauth.account.models import EmailAddress
+from allauth.account.signals import email_confirmed
+from django.contrib.auth.models import User
+from djstripe import models as djstripe_models
+
+from core.utils import clear_active_price_id, get_active_price_id, is_email_verified
+
+
+@pytest.fixture
+def product(db):
+    return djstripe_models.Product.objects.create(id="prod_test", name="pro")
+
+
+@pytest.mark.django_db
+class TestGetActivePriceId:
+    def test_returns_cached_active_price(self, product, django_assert_num_queries):
+        djstripe_models.Price.objects.create(
+            id="price_test", product=product, active=True, currency="usd"
+        )
+
+        assert get_active_price_id("pro") == "price_test"
+        with django_assert_num_queries(0):
+            assert get_active_price_id("pro") == "price_test"
+
+    def test_clear_active_price_id_forces_lookup(self, product):
+        price = djstripe_models.Price.objects.create(
+            id="price_old", product=product, active=True, currency="usd"
+        )
+        assert get_active_price_id("pro") == "price_old"
+
+        price.active = False
+        price.save()
+        djstripe_models.Price.objects.create(
+            id="price_new", product=product, active=True, currency="usd"
+        )
+        clear_active_price_id("pro")
+
+        assert get_active_price_id("pro") == "price_new"
+
+    def test_raises_without_active_price(self, product):
+        with pytest.raises(djstripe_models.Price.DoesNotExist):
+            get_active_price_id("pro")
+
+
+@pytest.mark.django_db
+class TestIsEmailVerified:
+    def test_cached_until_email_confirmed(self):
+        user = User.objects.create_user(username="test", email="test@test.com", password="test")
+        email_address = EmailAddress.objects.create(user=user, email=user.email, verified=False)
+
+        assert is_email_verified(user) is False
+
+        EmailAddress.objects.filter(pk=email_address.pk).update(verified=True)
+        assert is_email_verified(user) is False
+
+        email_confirmed.send(sender=EmailAddress, request=None, email_address=email_address)
+        assert is_email_verified(user) is True
+
+    def test_missing_email_address_is_unverified(self):
+        user = User.objects.create_user(username="test", email="test@test.com", password="test")
+
+        assert is_email_verified(user) is False
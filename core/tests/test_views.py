@@ -1,6 +1,8 @@
 import pytest
 from django.urls import reverse
 
+from core.models import BlogPost
+
 @pytest.mark.django_db
 class TestHomeView:
     def test_home_view_status_code(self, client):
@@ -12,3 +14,26 @@ class TestHomeView:
         url = reverse('home')
         response = client.get(url)
         assert 'pages/home.html' in [t.name for t in response.templates]
+
+
+@pytest.mark.django_db
+class TestBlogPostView:
+    def test_etag_tracks_edits(self, client):
+        blog_post = BlogPost.objects.create(
+            title="Hello", slug="hello", content="First", image="blog_post_images/hello.png"
+        )
+        url = reverse('blog_post', kwargs={'slug': blog_post.slug})
+
+        response = client.get(url)
+        assert response.status_code == 200
+        etag = response['ETag']
+
+        assert client.get(url, headers={'If-None-Match': etag}).status_code == 304
+
+        blog_post.content = "Second"
+        blog_post.save()
+
+        response = client.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response['ETag'] != etag
+        assert b"Second" in response.content
@@ -1,7 +1,10 @@
 import requests
 
+from allauth.account.models import EmailAddress
+from django.core.cache import cache
 from django.forms.utils import ErrorList
 from django.conf import settings
+from djstripe import models as djstripe_models
 
 from core.models import Profile
 
@@ -40,3 +43,73 @@ def ping_healthchecks(ping_id):
     except requests.RequestException as e:
         logger.error("Ping failed", error=e, exc_info=True)
 
+
+
+STRIPE_PRICE_CACHE_TIMEOUT = 60 * 60
+
+
+def get_stripe_price_cache_key(plan):
+    return f"stripe:price:{plan}"
+
+
+def get_active_price_id(plan):
+    """Return the id of the active Price for the Product named `plan`, cached for an hour."""
+    cache_key = get_stripe_price_cache_key(plan)
+    price_id = cache.get(cache_key)
+    if price_id is not None:
+        return price_id
+
+    product = djstripe_models.Product.objects.only("id").get(name=plan)
+    price_id = product.prices.filter(active=True).values_list("id", flat=True).first()
+    if price_id is None:
+        logger.error("No active price found for product", plan=plan, product_id=product.id)
+        raise djstripe_models.Price.DoesNotExist(f"No active price for product '{plan}'.")
+
+    cache.set(cache_key, price_id, STRIPE_PRICE_CACHE_TIMEOUT)
+    return price_id
+
+
+def clear_active_price_id(plan):
+    cache.delete(get_stripe_price_cache_key(plan))
+
+
+EMAIL_VERIFIED_CACHE_TIMEOUT = 60
+
+
+def get_email_verified_cache_key(user_id):
+    return f"email_verified:{user_id}"
+
+
+def is_email_verified(user):
+    """Return whether the user's primary email is verified, cached for a minute."""
+    cache_key = get_email_verified_cache_key(user.id)
+    email_verified = cache.get(cache_key)
+    if email_verified is not None:
+        return email_verified
+
+    email_verified = (
+        EmailAddress.objects.filter(user_id=user.id, email__iexact=user.email)
+        .values_list("verified", flat=True)
+        .first()
+        or False
+    )
+    cache.set(cache_key, email_verified, EMAIL_VERIFIED_CACHE_TIMEOUT)
+    return email_verified
+
+
+def clear_email_verified(user_id):
+    cache.delete(get_email_verified_cache_key(user_id))
+
+
+def get_request_profile(request):
+    """
+    Fetch the authenticated user's profile once per request, with its Stripe relations
+    and current state, and reuse it for the rest of the request.
+    """
+    if not hasattr(request, "_profile"):
+        request._profile = (
+            Profile.objects.with_current_state()
+            .select_related("subscription", "product", "customer", "user")
+            .get(user=request.user)
+        )
+    return request._profile
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from urllib.parse import urlencode
 
 import stripe
@@ -10,17 +11,23 @@ from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.messages.views import SuccessMessageMixin
 from django.core.mail import EmailMultiAlternatives
-from django.http import HttpResponse
+from django.http import HttpResponse, HttpResponseForbidden
 from django.shortcuts import redirect
 from django.template.loader import render_to_string
 from django.urls import reverse, reverse_lazy
+from django.utils.decorators import method_decorator
 from django.utils.html import strip_tags
+from django.views.decorators.cache import cache_page
+from django.views.decorators.http import etag
+from django.views.decorators.vary import vary_on_headers
 from django.views.generic import DetailView, ListView, TemplateView, UpdateView
 from django_q.tasks import async_task
 from djstripe import models as djstripe_models
 
+from core.choices import BlogPostStatus
 from core.forms import ProfileUpdateForm, SourceForm
 from core.models import BlogPost, Profile, Source
+from core.utils import get_active_price_id, get_request_profile, is_email_verified
 from knowthyself.utils import get_knowthyself_logger
 
 stripe.api_key = settings.STRIPE_SECRET_KEY
@@ -43,8 +50,7 @@ class HomeView(TemplateView):
             messages.error(self.request, "Something went wrong with the payment.")
 
         if self.request.user.is_authenticated and settings.POSTHOG_API_KEY:
-            user = self.request.user
-            profile = user.profile
+            profile = get_request_profile(self.request)
 
             async_task(
                 "core.tasks.try_create_posthog_alias",
@@ -67,25 +73,13 @@ class AccountSignupView(SignupView):
         profile = user.profile
 
         async_task(
-            "core.tasks.try_create_posthog_alias",
+            "core.tasks.signup_posthog_bundle",
             profile_id=profile.id,
             cookies=self.request.COOKIES,
+            email=profile.user.email,
+            username=profile.user.username,
             source_function="AccountSignupView - form_valid",
-            group="Create Posthog Alias",
-        )
-
-        async_task(
-            "core.tasks.track_event",
-            profile_id=profile.id,
-            event_name="user_signed_up",
-            properties={
-                "$set": {
-                    "email": profile.user.email,
-                    "username": profile.user.username,
-                },
-            },
-            source_function="AccountSignupView - form_valid",
-            group="Track Event",
+            group="Signup PostHog",
         )
 
         return response
@@ -100,16 +94,15 @@ class UserSettingsView(LoginRequiredMixin, SuccessMessageMixin, UpdateView):
     template_name = "pages/user-settings.html"
 
     def get_object(self):
-        return self.request.user.profile
+        return get_request_profile(self.request)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         user = self.request.user
 
-        email_address = EmailAddress.objects.get_for_user(user, user.email)
-        context["email_verified"] = email_address.verified
+        context["email_verified"] = is_email_verified(user)
         context["resend_confirmation_url"] = reverse("resend_confirmation")
-        context["has_subscription"] = user.profile.has_product_or_subscription
+        context["has_subscription"] = self.object.has_active_subscription
 
         return context
 
@@ -159,7 +152,7 @@ class PricingView(TemplateView):
 
         if self.request.user.is_authenticated:
             try:
-                profile = self.request.user.profile
+                profile = get_request_profile(self.request)
                 context["has_pro_subscription"] = profile.has_active_subscription
             except Profile.DoesNotExist:
                 context["has_pro_subscription"] = False
@@ -169,25 +162,28 @@ class PricingView(TemplateView):
         return context
 
 
+CHECKOUT_SUCCESS_QUERY = f"?{urlencode({'payment': 'success'})}"
+CHECKOUT_CANCEL_QUERY = f"?{urlencode({'payment': 'failed'})}"
+
+
+@lru_cache(maxsize=8)
+def _home_url(host, scheme):
+    return f"{scheme}://{host}{reverse('home')}"
+
+
 def create_checkout_session(request, pk, plan):
     user = request.user
 
-    product = djstripe_models.Product.objects.get(name=plan)
-    price = product.prices.filter(active=True).first()
+    price_id = get_active_price_id(plan)
     customer, _ = djstripe_models.Customer.get_or_create(subscriber=user)
 
     profile = user.profile
-    profile.customer = customer
-    profile.save(update_fields=["customer"])
-
-    base_success_url = request.build_absolute_uri(reverse("home"))
-    base_cancel_url = request.build_absolute_uri(reverse("home"))
-
-    success_params = {"payment": "success"}
-    success_url = f"{base_success_url}?{urlencode(success_params)}"
+    if profile.customer_id != customer.pk:
+        Profile.objects.filter(pk=profile.pk).update(customer=customer)
 
-    cancel_params = {"payment": "failed"}
-    cancel_url = f"{base_cancel_url}?{urlencode(cancel_params)}"
+    home_url = _home_url(request.get_host(), request.scheme)
+    success_url = f"{home_url}{CHECKOUT_SUCCESS_QUERY}"
+    cancel_url = f"{home_url}{CHECKOUT_CANCEL_QUERY}"
 
     checkout_session = stripe.checkout.Session.create(
         customer=customer.id,
@@ -196,7 +192,7 @@ def create_checkout_session(request, pk, plan):
         automatic_tax={"enabled": True},
         line_items=[
             {
-                "price": price.id,
+                "price": price_id,
                 "quantity": 1,
             }
         ],
@@ -206,7 +202,7 @@ def create_checkout_session(request, pk, plan):
         customer_update={
             "address": "auto",
         },
-        metadata={"user_id": user.id, "pk": pk, "price_id": price.id},
+        metadata={"user_id": user.id, "pk": pk, "price_id": price_id},
     )
 
     return redirect(checkout_session.url, code=303)
@@ -219,27 +215,56 @@ def create_customer_portal_session(request):
 
     session = stripe.billing_portal.Session.create(
         customer=customer.id,
-        return_url=request.build_absolute_uri(reverse("home")),
+        return_url=_home_url(request.get_host(), request.scheme),
     )
 
     return redirect(session.url, code=303)
 
 
+def _blog_post_etag(request, slug):
+    updated_at = BlogPost.objects.filter(slug=slug).values_list("updated_at", flat=True).first()
+    if updated_at is None:
+        return None
+    return f"{updated_at.timestamp()}-{request.user.pk}"
+
+
+@method_decorator(cache_page(60 * 5), name="dispatch")
+@method_decorator(vary_on_headers("Cookie"), name="dispatch")
 class BlogView(ListView):
     model = BlogPost
     template_name = "blog/blog_posts.html"
     context_object_name = "blog_posts"
 
+    def get_queryset(self):
+        return (
+            BlogPost.objects.filter(status=BlogPostStatus.PUBLISHED)
+            .only("title", "slug", "description", "icon", "image", "created_at")
+            .order_by("-created_at")
+        )
 
+
+@method_decorator(etag(_blog_post_etag), name="dispatch")
+@method_decorator(vary_on_headers("Cookie"), name="dispatch")
 class BlogPostView(DetailView):
     model = BlogPost
     template_name = "blog/blog_post.html"
     context_object_name = "blog_post"
 
+    def get_queryset(self):
+        return BlogPost.objects.defer("icon")
 
-def test_mjml(request):
+
+@lru_cache(maxsize=1)
+def _render_test_mjml():
     html_content = render_to_string("emails/test_mjml.html", {})
-    text_content = strip_tags(html_content)
+    return html_content, strip_tags(html_content)
+
+
+def test_mjml(request):
+    if settings.ENVIRONMENT != "dev" and not request.user.is_staff:
+        return HttpResponseForbidden()
+
+    html_content, text_content = _render_test_mjml()
 
     email = EmailMultiAlternatives(
         "Subject",
@@ -2,11 +2,49 @@ from djstripe.event_handlers import djstripe_receiver
 from djstripe.models import Customer, Event, Price, Product, Subscription
 
 from core.models import Profile, ProfileStates
+from core.utils import clear_active_price_id
 from knowthyself.utils import get_knowthyself_logger
 
 logger = get_knowthyself_logger(__name__)
 
 
+@djstripe_receiver(["product.created", "product.updated", "product.deleted"])
+def handle_product_change(**kwargs):
+    event = kwargs["event"]
+    product_data = event.data["object"]
+    previous_attributes = event.data.get("previous_attributes") or {}
+
+    for name in {product_data.get("name"), previous_attributes.get("name")}:
+        if name:
+            clear_active_price_id(name)
+
+    logger.info(
+        "Cleared cached price for product",
+        webhook="handle_product_change",
+        event_id=event.id,
+        product_id=product_data.get("id"),
+    )
+
+
+@djstripe_receiver(["price.created", "price.updated", "price.deleted"])
+def handle_price_change(**kwargs):
+    event = kwargs["event"]
+    product_id = event.data["object"].get("product")
+
+    product_name = (
+        Product.objects.filter(id=product_id).values_list("name", flat=True).first()
+    )
+    if product_name:
+        clear_active_price_id(product_name)
+
+    logger.info(
+        "Cleared cached price for product",
+        webhook="handle_price_change",
+        event_id=event.id,
+        product_id=product_id,
+    )
+
+
 @djstripe_receiver("customer.subscription.created")
 def handle_created_subscription(**kwargs):
     event_id = kwargs["event"].id
@@ -310,6 +310,14 @@ Q_CLUSTER = {
 
 Q_CLUSTER["error_reporter"] = {"sentry": {"dsn": SENTRY_DSN}}
 
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": REDIS_URL,
+        "KEY_PREFIX": "knowthyself",
+    }
+}
+
 
 
 LOGGING = {
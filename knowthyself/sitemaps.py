@@ -42,7 +42,10 @@ sitemaps = {
     "static": StaticViewSitemap,
     
     "blog": GenericSitemap(
-        {"queryset": BlogPost.objects.all(), "date_field": "created_at"},
+        {
+            "queryset": BlogPost.objects.only("slug", "created_at"),
+            "date_field": "created_at",
+        },
         priority=0.85,
         protocol="https",
     ),
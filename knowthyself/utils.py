@@ -1,6 +1,9 @@
+from functools import cache
+
 import structlog
 
 
+@cache
 def get_knowthyself_logger(name):
     """This will add a `knowthyself` prefix to logger for easy configuration."""
 